@@ -4,7 +4,7 @@ UnitConverterクラスの使用例とテスト
 """
 
 import numpy as np
-from unit_converter import UnitConverter
+from unit_converter import NUMBA_AVAILABLE, PARALLEL_THRESHOLD, UnitConverter
 
 def test_basic_conversions():
     """基本的な単位変換のテスト"""
@@ -112,6 +112,87 @@ def test_error_handling():
     
     print()
 
+def test_out_and_dtype():
+    """out・dtype・一括変換のテスト"""
+    print("=== out・dtype・一括変換のテスト ===")
+    converter = UnitConverter()
+    
+    # out=入力配列 でインプレース変換
+    wavelength = np.array([400.0, 500.0, 600.0])
+    result = converter.convert_wavelength(wavelength, 'nm', 'um', out=wavelength)
+    assert result is wavelength and np.allclose(wavelength, [0.4, 0.5, 0.6])
+    print(f"インプレース波長変換: {wavelength} um")
+    
+    # 入力と一部だけ重なる out でも、Numbaを使う大きさの配列で正しく計算できる
+    n = PARALLEL_THRESHOLD + 1
+    buffer = np.arange(1.0, n + 2)
+    expected = converter.intensity_to_electric_field(buffer[:-1].copy(), 'W/m2', 'V/m')
+    converter.intensity_to_electric_field(buffer[:-1], 'W/m2', 'V/m', out=buffer[1:])
+    assert np.allclose(buffer[1:], expected)
+    print(f"重なる out での強度から電場: {n} 要素で一致")
+    
+    # 2乗を含む変換も out=入力配列 で正しく計算できる
+    electric_field = np.array([1e9, 2e9, 3e9])
+    expected = converter.electric_field_to_intensity(electric_field, 'V/m', 'W/cm2')
+    result = converter.electric_field_to_intensity(electric_field, 'V/m', 'W/cm2', out=electric_field)
+    assert result is electric_field and np.allclose(electric_field, expected)
+    print(f"インプレース電場から強度: {electric_field} W/cm2")
+    
+    # float32 の配列は float32 のまま変換され、往復で元の値に戻る
+    wavelength_f32 = np.array([400.0, 532.0, 800.0], dtype=np.float32)
+    wavelength_um = converter.convert_wavelength(wavelength_f32, 'nm', 'um')
+    wavelength_back = converter.convert_wavelength(wavelength_um, 'um', 'nm')
+    assert wavelength_um.dtype == wavelength_back.dtype == np.float32
+    assert np.allclose(wavelength_back, wavelength_f32)
+    wavelength_um = converter.convert_wavelength([400.0, 532.0], 'nm', 'um', dtype=np.float32)
+    assert wavelength_um.dtype == np.float32
+    print(f"float32 の往復変換: {wavelength_f32} nm -> {wavelength_back} nm")
+    
+    # 整数型の dtype は変換比が切り捨てられるためエラー
+    try:
+        converter.convert_wavelength(wavelength_f32, 'nm', 'um', dtype=np.int32)
+    except ValueError as e:
+        print(f"期待されるエラー: {e}")
+    else:
+        raise AssertionError("整数型の dtype でエラーになりませんでした")
+    
+    # 一括変換はリストを受け取りnumpy配列を返す
+    intensities = converter.convert_intensity_batch([1e12, 1e13], 'W/cm2', 'W/m2')
+    assert isinstance(intensities, np.ndarray) and np.allclose(intensities, [1e16, 1e17])
+    print(f"一括強度変換: [1e12, 1e13] W/cm2 = {intensities} W/m2")
+    
+    print()
+
+def test_large_arrays():
+    """大規模配列（Numbaカーネル）のテスト"""
+    print("=== 大規模配列のテスト ===")
+    converter = UnitConverter()
+    n = PARALLEL_THRESHOLD
+    print(f"Numba: {'使用' if NUMBA_AVAILABLE else '未インストール'}（しきい値 {n} 要素）")
+    
+    # しきい値未満（numpy）としきい値以上（Numba）で同じ結果になる
+    wavelength = np.linspace(400.0, 1600.0, n + 1)
+    intensity = np.linspace(1e12, 1e16, n + 1)
+    for name, x, args in [('intensity_to_electric_field', intensity, ('W/cm2', 'V/m')),
+                          ('electric_field_to_intensity', intensity, ('V/m', 'W/cm2'))]:
+        convert = getattr(converter, name)
+        small = convert(x[:n - 1], *args)
+        large = convert(x, *args)
+        assert np.allclose(large[:n - 1], small)
+        print(f"{name}: しきい値の前後で一致")
+    
+    # まとめて計算した結果が個別の変換と一致する
+    frequency, wavenumber, electric_field = converter.convert_laser_pulse(
+        wavelength, intensity, wavelength_unit='nm', intensity_unit='W/cm2',
+        frequency_unit='THz', wavenumber_unit='1/cm', electric_field_unit='GV/m')
+    assert np.allclose(frequency, converter.wavelength_to_frequency(wavelength, 'nm', 'THz'))
+    assert np.allclose(wavenumber, converter.wavelength_to_wavenumber(wavelength, 'nm', '1/cm'))
+    assert np.allclose(electric_field,
+                       converter.intensity_to_electric_field(intensity, 'W/cm2', 'GV/m'))
+    print("convert_laser_pulse: 個別の変換と一致")
+    
+    print()
+
 def practical_example():
     """実用的な例"""
     print("=== 実用的な例 ===")
@@ -147,6 +228,25 @@ def practical_example():
     
     print()
 
+def converter_function_example():
+    """単位を固定した変換関数の例"""
+    print("=== 単位を固定した変換関数の例 ===")
+    converter = UnitConverter()
+    
+    # 同じ単位の変換を繰り返す場合は変換関数を一度だけ作成する
+    conv = converter.make_converter('wavelength', 'nm', 'um')
+    stream = [400.0, 532.0, 800.0, 1064.0]
+    out = []
+    for wavelength_nm in stream:
+        out.append(conv(wavelength_nm))
+    print(f"波長変換: {stream} nm = {out} um")
+    
+    # 物理量間の変換も同様に作成できる
+    to_field = converter.make_converter('intensity_to_electric_field', 'W/cm2', 'GV/m')
+    print(f"強度から電場: 1e14 W/cm2 = {to_field(1e14):.2f} GV/m")
+    
+    print()
+
 def main():
     """メイン関数"""
     print("UnitConverter テストプログラム")
@@ -156,6 +256,9 @@ def main():
     test_physical_conversions()
     test_single_values()
     test_error_handling()
+    test_out_and_dtype()
+    test_large_arrays()
+    converter_function_example()
     practical_example()
     
     print("すべてのテストが完了しました。")
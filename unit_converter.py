@@ -1,356 +1,816 @@
+import functools
+import importlib.util
+import math
 import numpy as np
-from typing import Union, Tuple
+import numpy.typing
+from types import MappingProxyType
+from typing import Callable, Optional, Sequence, Union, Tuple, cast
 
-class UnitConverter:
-    """
-    物理量の単位変換を行うクラス
-    対応物理量: フルエンス、波長、波数、周波数、電場、intensity
+# numbaがインストールされていれば、大規模配列の強度と電場の相互変換にNumbaカーネルを使用する
+# numba の読み込みとカーネルのコンパイルは時間がかかるため、初めて大規模配列を変換するときに行う
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# この要素数以上のfloat64/float32配列でNumbaカーネルを使用する
+# 単純な乗算・除算はnumpyでも1回の走査で済み、Numbaでも速くならないため対象外
+# sqrt と2乗のカーネルは1コアでも10万要素以上でnumpyより1.2～2.7倍速い
+PARALLEL_THRESHOLD = 100_000
+
+# 物理定数
+C = 299792458.0  # 光速 [m/s]
+H = 6.62607015e-34  # プランク定数 [J⋅s]
+HBAR = 1.054571817e-34  # 換算プランク定数 [J⋅s]
+EPSILON0 = 8.8541878128e-12  # 真空の誘電率 [F/m]
+MU0 = 1.25663706212e-6  # 真空の透磁率 [H/m]
+
+# 波長と波数の変換で使う定数
+_TWO_PI = 2.0 * math.pi  # k = _TWO_PI / λ
+
+# 強度と電場の変換で使う定数
+_E_FROM_I_COEF = 2.0 / (C * EPSILON0)  # E^2 = _E_FROM_I_COEF * I
+_I_FROM_E_COEF = 0.5 * C * EPSILON0  # I = _I_FROM_E_COEF * E^2
+
+# 長さの変換係数
+_LENGTH = MappingProxyType({
+    'm': 1.0,
+    'cm': 1e-2,
+    'mm': 1e-3,
+    'um': 1e-6,
+    'nm': 1e-9,
+    'pm': 1e-12,
+    'angstrom': 1e-10,
+    'ft': 0.3048,
+    'in': 0.0254
+})
+
+# 時間の変換係数
+_TIME = MappingProxyType({
+    's': 1.0,
+    'ms': 1e-3,
+    'us': 1e-6,
+    'ns': 1e-9,
+    'ps': 1e-12,
+    'fs': 1e-15
+})
+
+# エネルギーの変換係数
+_ENERGY = MappingProxyType({
+    'J': 1.0,
+    'mJ': 1e-3,
+    'uJ': 1e-6,
+    'nJ': 1e-9,
+    'pJ': 1e-12,
+    'eV': 1.602176634e-19,
+    'meV': 1.602176634e-22,
+    'keV': 1.602176634e-16,
+    'MeV': 1.602176634e-13
+})
+
+# 周波数の変換係数
+_FREQUENCY = MappingProxyType({
+    'Hz': 1.0,
+    'kHz': 1e3,
+    'MHz': 1e6,
+    'GHz': 1e9,
+    'THz': 1e12
+})
+
+# 波数の単位変換係数
+_WAVENUMBER = MappingProxyType({
+    '1/m': 1.0,
+    '1/cm': 1e2,
+    '1/mm': 1e3,
+    '1/um': 1e6,
+    '1/nm': 1e9
+})
+
+# フルエンスの単位変換係数
+_FLUENCE = MappingProxyType({
+    'J/m2': 1.0,
+    'mJ/m2': 1e-3,
+    'uJ/m2': 1e-6,
+    'nJ/m2': 1e-9,
+    'J/cm2': 1e4,
+    'mJ/cm2': 10.0,
+    'uJ/cm2': 1e-2,
+    'nJ/cm2': 1e-5
+})
+
+# 電場の変換係数
+_ELECTRIC_FIELD = MappingProxyType({
+    'V/m': 1.0,
+    'kV/m': 1e3,
+    'MV/m': 1e6,
+    'GV/m': 1e9
+})
+
+# 強度の変換係数
+_INTENSITY = MappingProxyType({
+    'W/m2': 1.0,
+    'mW/m2': 1e-3,
+    'uW/m2': 1e-6,
+    'nW/m2': 1e-9,
+    'W/cm2': 1e4,
+    'mW/cm2': 10.0,
+    'uW/cm2': 1e-2,
+    'nW/cm2': 1e-5
+})
+
+# 変換表名 -> 単位変換係数
+_TABLES = MappingProxyType({
+    'length': _LENGTH,
+    'frequency': _FREQUENCY,
+    'wavenumber': _WAVENUMBER,
+    'fluence': _FLUENCE,
+    'electric_field': _ELECTRIC_FIELD,
+    'intensity': _INTENSITY
+})
+
+# 変換表名 -> 変換前の単位 -> 変換後の単位 -> 変換比
+# 単位の組は少ないため、すべての変換比を読み込み時に計算しておく
+_RATIOS = MappingProxyType({
+    table_id: MappingProxyType({
+        from_unit: MappingProxyType({to_unit: f_from / f_to for to_unit, f_to in table.items()})
+        for from_unit, f_from in table.items()
+    })
+    for table_id, table in _TABLES.items()
+})
+_LENGTH_RATIOS = _RATIOS['length']
+_FREQUENCY_RATIOS = _RATIOS['frequency']
+_WAVENUMBER_RATIOS = _RATIOS['wavenumber']
+_FLUENCE_RATIOS = _RATIOS['fluence']
+_ELECTRIC_FIELD_RATIOS = _RATIOS['electric_field']
+_INTENSITY_RATIOS = _RATIOS['intensity']
+
+# 物理量ごとの単位変換表: 物理量名 -> 変換表名
+_LINEAR_TABLES = MappingProxyType({
+    'wavelength': 'length',
+    'frequency': 'frequency',
+    'wavenumber': 'wavenumber',
+    'fluence': 'fluence',
+    'electric_field': 'electric_field',
+    'intensity': 'intensity'
+})
+
+# 物理量間の変換: 変換名 -> (入力側の変換係数, 出力側の変換係数, 係数の計算式)
+# 計算式は入力・出力の単位変換係数から、定数と単位をまとめた係数を返す
+_CROSS_CONVERSIONS = MappingProxyType({
+    # f = c/λ
+    'wavelength_to_frequency': (_LENGTH, _FREQUENCY,
+                                lambda f_in, f_out: C / (f_in * f_out)),
+    # λ = c/f
+    'frequency_to_wavelength': (_FREQUENCY, _LENGTH,
+                                lambda f_in, f_out: C / (f_in * f_out)),
+    # k = 2π/λ
+    'wavelength_to_wavenumber': (_LENGTH, _WAVENUMBER,
+                                 lambda f_in, f_out: _TWO_PI / (f_in * f_out)),
+    # λ = 2π/k
+    'wavenumber_to_wavelength': (_WAVENUMBER, _LENGTH,
+                                 lambda f_in, f_out: _TWO_PI / (f_in * f_out)),
+    # E = sqrt(2*I/(c*ε0))
+    'intensity_to_electric_field': (_INTENSITY, _ELECTRIC_FIELD,
+                                    lambda f_in, f_out: _E_FROM_I_COEF * f_in / f_out**2),
+    # I = (1/2)*c*ε0*E^2
+    'electric_field_to_intensity': (_ELECTRIC_FIELD, _INTENSITY,
+                                    lambda f_in, f_out: _I_FROM_E_COEF * f_in**2 / f_out)
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernels():
+    """Numbaカーネルのモジュールを読み込む（読み込めない場合は None）"""
+    try:
+        import unit_converter_numba
+    except ImportError:
+        return None
+    return unit_converter_numba
+
+
+def _use_numba(value, out: Optional[np.ndarray] = None) -> bool:
+    """Numbaカーネルを使う大きさのfloat64/float32配列かどうか"""
+    if not (NUMBA_AVAILABLE and isinstance(value, np.ndarray)
+            and value.dtype in (np.float64, np.float32) and value.size >= PARALLEL_THRESHOLD):
+        return False
+    if out is not None:
+        # out はカーネルが直接書き込めるC連続の同じ型の配列に限る
+        if not (out.dtype == value.dtype and out.shape == value.shape
+                and out.flags.c_contiguous):
+            return False
+        # 入力と一部だけ重なる out は、並列ループが書き換え済みの要素を読むためnumpyに任せる
+        if out is not value and np.may_share_memory(out, value):
+            return False
+    return _numba_kernels() is not None
+
+
+def _run_kernel(kernel: str, value: np.ndarray, k: float,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """1次元に平坦化した配列にNumbaカーネルを適用し、元の形状で返す"""
+    if out is None:
+        out = np.empty(value.shape, dtype=value.dtype)
+    getattr(_numba_kernels(), kernel)(out.reshape(-1), np.ravel(value), value.dtype.type(k))
+    return out
+
+
+def _ratio(table_id: str, from_unit: str, to_unit: str) -> float:
     """
+    事前に計算した変換比を返す
     
-    # 物理定数
-    C = 299792458.0  # 光速 [m/s]
-    H = 6.62607015e-34  # プランク定数 [J⋅s]
-    HBAR = 1.054571817e-34  # 換算プランク定数 [J⋅s]
-    EPSILON0 = 8.8541878128e-12  # 真空の誘電率 [F/m]
-    MU0 = 1.25663706212e-6  # 真空の透磁率 [H/m]
-    
-    def __init__(self):
-        # 単位変換の辞書を初期化
-        self._init_conversion_factors()
-    
-    def _init_conversion_factors(self):
-        """単位変換係数を初期化"""
-        # 長さの変換係数
-        self.length_factors = {
-            'm': 1.0,
-            'cm': 1e-2,
-            'mm': 1e-3,
-            'um': 1e-6,
-            'nm': 1e-9,
-            'pm': 1e-12,
-            'angstrom': 1e-10,
-            'ft': 0.3048,
-            'in': 0.0254
-        }
-        
-        # 時間の変換係数
-        self.time_factors = {
-            's': 1.0,
-            'ms': 1e-3,
-            'us': 1e-6,
-            'ns': 1e-9,
-            'ps': 1e-12,
-            'fs': 1e-15
-        }
+    Args:
+        table_id: 変換表の名前 ('length' など)
+        from_unit: 変換前の単位
+        to_unit: 変換後の単位
         
-        # エネルギーの変換係数
-        self.energy_factors = {
-            'J': 1.0,
-            'mJ': 1e-3,
-            'uJ': 1e-6,
-            'nJ': 1e-9,
-            'pJ': 1e-12,
-            'eV': 1.602176634e-19,
-            'meV': 1.602176634e-22,
-            'keV': 1.602176634e-16,
-            'MeV': 1.602176634e-13
-        }
+    Returns:
+        変換比
+    """
+    try:
+        return _RATIOS[table_id][from_unit][to_unit]
+    except KeyError:
+        raise ValueError(f"サポートされていない単位: {from_unit} または {to_unit}") from None
+
+
+def _apply(table_id: str, value: Union[float, np.ndarray],
+           from_unit: str, to_unit: str, out: Optional[np.ndarray] = None,
+           dtype: Optional[np.typing.DTypeLike] = None) -> Union[float, np.ndarray]:
+    """
+    事前に計算した変換比を掛けて単位変換を行う
+    
+    Args:
+        table_id: 変換表の名前 ('length' など)
+        value: 変換する値または配列
+        from_unit: 変換前の単位
+        to_unit: 変換後の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
+        dtype: 計算に使う浮動小数点型（float32 以上、省略時は入力の型）
         
-        # 周波数の変換係数
-        self.frequency_factors = {
-            'Hz': 1.0,
-            'kHz': 1e3,
-            'MHz': 1e6,
-            'GHz': 1e9,
-            'THz': 1e12
-        }
+    Returns:
+        変換後の値または配列
+    """
+    ratio = _ratio(table_id, from_unit, to_unit)
+    if dtype is not None:
+        # 整数型では変換比が切り捨てられ、float16 では範囲を超えやすいため float32 以上に限る
+        dtype = np.dtype(dtype)
+        if not (np.issubdtype(dtype, np.floating) and dtype.itemsize >= 4):
+            raise ValueError(f"サポートされていない型: {dtype}（float32 以上の浮動小数点型を指定してください）")
+    x = np.asarray(value, dtype=dtype)
+    if dtype is not None:
+        # 変換比を同じ型にして、numpyが float64 に型を上げないようにする
+        ratio = x.dtype.type(ratio)
+    return np.multiply(x, ratio, out=out)
+
+
+def _divide(k: float, value: Union[float, np.ndarray],
+            out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
+    """
+    k/x を計算する（波長・周波数・波数の相互変換）
+    
+    Args:
+        k: 定数と単位変換係数をまとめた係数
+        value: 変換する値または配列
+        out: 結果を書き込む配列（省略時は新しく確保する）
         
-        # 電場の変換係数
-        self.electric_field_factors = {
-            'V/m': 1.0,
-            'kV/m': 1e3,
-            'MV/m': 1e6,
-            'GV/m': 1e9
-        }
+    Returns:
+        変換後の値または配列
+    """
+    if out is None and isinstance(value, (int, float)):
+        return k / value
+    return np.divide(k, np.asarray(value), out=out)
+
+
+@functools.lru_cache(maxsize=128)
+def _coef(kind: str, in_unit: str, out_unit: str) -> float:
+    """
+    物理量間の変換で使う係数を単位の組ごとにキャッシュして返す
+    
+    Args:
+        kind: 変換名 ('wavelength_to_frequency' など)
+        in_unit: 入力の単位
+        out_unit: 出力の単位
         
-        # 強度の変換係数
-        self.intensity_factors = {
-            'W/m2': 1.0,
-            'mW/m2': 1e-3,
-            'uW/m2': 1e-6,
-            'nW/m2': 1e-9,
-            'W/cm2': 1e4,
-            'mW/cm2': 10.0,
-            'uW/cm2': 1e-2,
-            'nW/cm2': 1e-5
-        }
-    
-    def convert_wavelength(self, wavelength: Union[float, np.ndarray], 
-                          from_unit: str, to_unit: str) -> Union[float, np.ndarray]:
-        """
-        波長の単位変換
+    Returns:
+        変換係数
+    """
+    in_table, out_table, formula = _CROSS_CONVERSIONS[kind]
+    f_in = in_table.get(in_unit)
+    f_out = out_table.get(out_unit)
+    if f_in is None or f_out is None:
+        raise ValueError(f"サポートされていない単位: {in_unit} または {out_unit}")
+    return formula(f_in, f_out)
+
+
+def convert_wavelength(wavelength: Union[float, np.ndarray],
+                       from_unit: str, to_unit: str,
+                       out: Optional[np.ndarray] = None,
+                       dtype: Optional[np.typing.DTypeLike] = None) -> Union[float, np.ndarray]:
+    """
+    波長の単位変換
+    
+    Args:
+        wavelength: 波長の値または配列
+        from_unit: 変換前の単位 ('m', 'nm', 'um', 'angstrom' など)
+        to_unit: 変換後の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
+        dtype: 計算に使う浮動小数点型（float32 以上、省略時は入力の型）
         
-        Args:
-            wavelength: 波長の値または配列
-            from_unit: 変換前の単位 ('m', 'nm', 'um', 'angstrom' など)
-            to_unit: 変換後の単位
-            
-        Returns:
-            変換後の波長の値または配列
-        """
-        if from_unit not in self.length_factors or to_unit not in self.length_factors:
-            raise ValueError(f"サポートされていない単位: {from_unit} または {to_unit}")
+    Returns:
+        変換後の波長の値または配列
+    """
+    if isinstance(wavelength, (float, int)) and out is None and dtype is None:
+        try:
+            return wavelength * _LENGTH_RATIOS[from_unit][to_unit]
+        except KeyError:
+            pass  # 不正な単位は _apply で ValueError になる
+    return _apply('length', wavelength, from_unit, to_unit, out, dtype)
+
+
+def convert_frequency(frequency: Union[float, np.ndarray],
+                      from_unit: str, to_unit: str,
+                      out: Optional[np.ndarray] = None,
+                      dtype: Optional[np.typing.DTypeLike] = None) -> Union[float, np.ndarray]:
+    """
+    周波数の単位変換
+    
+    Args:
+        frequency: 周波数の値または配列
+        from_unit: 変換前の単位 ('Hz', 'kHz', 'THz' など)
+        to_unit: 変換後の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
+        dtype: 計算に使う浮動小数点型（float32 以上、省略時は入力の型）
         
-        # 基本単位（メートル）に変換
-        base_value = wavelength * self.length_factors[from_unit]
-        # 目標単位に変換
-        return base_value / self.length_factors[to_unit]
-    
-    def convert_frequency(self, frequency: Union[float, np.ndarray], 
-                         from_unit: str, to_unit: str) -> Union[float, np.ndarray]:
-        """
-        周波数の単位変換
+    Returns:
+        変換後の周波数の値または配列
+    """
+    if isinstance(frequency, (float, int)) and out is None and dtype is None:
+        try:
+            return frequency * _FREQUENCY_RATIOS[from_unit][to_unit]
+        except KeyError:
+            pass  # 不正な単位は _apply で ValueError になる
+    return _apply('frequency', frequency, from_unit, to_unit, out, dtype)
+
+
+def convert_wavenumber(wavenumber: Union[float, np.ndarray],
+                       from_unit: str, to_unit: str,
+                       out: Optional[np.ndarray] = None,
+                       dtype: Optional[np.typing.DTypeLike] = None) -> Union[float, np.ndarray]:
+    """
+    波数の単位変換
+    
+    Args:
+        wavenumber: 波数の値または配列
+        from_unit: 変換前の単位 ('1/m', '1/cm', '1/mm' など)
+        to_unit: 変換後の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
+        dtype: 計算に使う浮動小数点型（float32 以上、省略時は入力の型）
         
-        Args:
-            frequency: 周波数の値または配列
-            from_unit: 変換前の単位 ('Hz', 'kHz', 'THz' など)
-            to_unit: 変換後の単位
-            
-        Returns:
-            変換後の周波数の値または配列
-        """
-        if from_unit not in self.frequency_factors or to_unit not in self.frequency_factors:
-            raise ValueError(f"サポートされていない単位: {from_unit} または {to_unit}")
+    Returns:
+        変換後の波数の値または配列
+    """
+    if isinstance(wavenumber, (float, int)) and out is None and dtype is None:
+        try:
+            return wavenumber * _WAVENUMBER_RATIOS[from_unit][to_unit]
+        except KeyError:
+            pass  # 不正な単位は _apply で ValueError になる
+    return _apply('wavenumber', wavenumber, from_unit, to_unit, out, dtype)
+
+
+def convert_fluence(fluence: Union[float, np.ndarray],
+                    from_unit: str, to_unit: str,
+                    out: Optional[np.ndarray] = None,
+                    dtype: Optional[np.typing.DTypeLike] = None) -> Union[float, np.ndarray]:
+    """
+    フルエンス（エネルギー密度）の単位変換
+    
+    Args:
+        fluence: フルエンスの値または配列
+        from_unit: 変換前の単位 ('J/m2', 'mJ/cm2', 'uJ/cm2' など)
+        to_unit: 変換後の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
+        dtype: 計算に使う浮動小数点型（float32 以上、省略時は入力の型）
         
-        # 基本単位（Hz）に変換
-        base_value = frequency * self.frequency_factors[from_unit]
-        # 目標単位に変換
-        return base_value / self.frequency_factors[to_unit]
-    
-    def convert_wavenumber(self, wavenumber: Union[float, np.ndarray], 
-                          from_unit: str, to_unit: str) -> Union[float, np.ndarray]:
-        """
-        波数の単位変換
+    Returns:
+        変換後のフルエンスの値または配列
+    """
+    if isinstance(fluence, (float, int)) and out is None and dtype is None:
+        try:
+            return fluence * _FLUENCE_RATIOS[from_unit][to_unit]
+        except KeyError:
+            pass  # 不正な単位は _apply で ValueError になる
+    return _apply('fluence', fluence, from_unit, to_unit, out, dtype)
+
+
+def convert_electric_field(electric_field: Union[float, np.ndarray],
+                           from_unit: str, to_unit: str,
+                           out: Optional[np.ndarray] = None,
+                           dtype: Optional[np.typing.DTypeLike] = None) -> Union[float, np.ndarray]:
+    """
+    電場の単位変換
+    
+    Args:
+        electric_field: 電場の値または配列
+        from_unit: 変換前の単位 ('V/m', 'kV/m', 'MV/m' など)
+        to_unit: 変換後の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
+        dtype: 計算に使う浮動小数点型（float32 以上、省略時は入力の型）
         
-        Args:
-            wavenumber: 波数の値または配列
-            from_unit: 変換前の単位 ('1/m', '1/cm', '1/mm' など)
-            to_unit: 変換後の単位
-            
-        Returns:
-            変換後の波数の値または配列
-        """
-        # 波数の単位変換係数
-        wavenumber_factors = {
-            '1/m': 1.0,
-            '1/cm': 1e2,
-            '1/mm': 1e3,
-            '1/um': 1e6,
-            '1/nm': 1e9
-        }
+    Returns:
+        変換後の電場の値または配列
+    """
+    if isinstance(electric_field, (float, int)) and out is None and dtype is None:
+        try:
+            return electric_field * _ELECTRIC_FIELD_RATIOS[from_unit][to_unit]
+        except KeyError:
+            pass  # 不正な単位は _apply で ValueError になる
+    return _apply('electric_field', electric_field, from_unit, to_unit, out, dtype)
+
+
+def convert_intensity(intensity: Union[float, np.ndarray],
+                      from_unit: str, to_unit: str,
+                      out: Optional[np.ndarray] = None,
+                      dtype: Optional[np.typing.DTypeLike] = None) -> Union[float, np.ndarray]:
+    """
+    強度（Intensity）の単位変換
+    
+    Args:
+        intensity: 強度の値または配列
+        from_unit: 変換前の単位 ('W/m2', 'W/cm2', 'mW/cm2' など)
+        to_unit: 変換後の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
+        dtype: 計算に使う浮動小数点型（float32 以上、省略時は入力の型）
         
-        if from_unit not in wavenumber_factors or to_unit not in wavenumber_factors:
-            raise ValueError(f"サポートされていない単位: {from_unit} または {to_unit}")
+    Returns:
+        変換後の強度の値または配列
+    """
+    if isinstance(intensity, (float, int)) and out is None and dtype is None:
+        try:
+            return intensity * _INTENSITY_RATIOS[from_unit][to_unit]
+        except KeyError:
+            pass  # 不正な単位は _apply で ValueError になる
+    return _apply('intensity', intensity, from_unit, to_unit, out, dtype)
+
+
+def convert_wavelength_batch(wavelengths: Sequence[float],
+                             from_unit: str, to_unit: str) -> np.ndarray:
+    """
+    波長の単位変換（リストなどの一括変換）
+    
+    Args:
+        wavelengths: 波長の値のシーケンス
+        from_unit: 変換前の単位
+        to_unit: 変換後の単位
         
-        # 基本単位（1/m）に変換
-        base_value = wavenumber * wavenumber_factors[from_unit]
-        # 目標単位に変換
-        return base_value / wavenumber_factors[to_unit]
-    
-    def convert_fluence(self, fluence: Union[float, np.ndarray], 
-                       from_unit: str, to_unit: str) -> Union[float, np.ndarray]:
-        """
-        フルエンス（エネルギー密度）の単位変換
+    Returns:
+        変換後の波長の配列
+    """
+    return cast(np.ndarray, convert_wavelength(np.asarray(wavelengths, dtype=np.float64),
+                                               from_unit, to_unit))
+
+
+def convert_frequency_batch(frequencies: Sequence[float],
+                            from_unit: str, to_unit: str) -> np.ndarray:
+    """
+    周波数の単位変換（リストなどの一括変換）
+    
+    Args:
+        frequencies: 周波数の値のシーケンス
+        from_unit: 変換前の単位
+        to_unit: 変換後の単位
         
-        Args:
-            fluence: フルエンスの値または配列
-            from_unit: 変換前の単位 ('J/m2', 'mJ/cm2', 'uJ/cm2' など)
-            to_unit: 変換後の単位
-            
-        Returns:
-            変換後のフルエンスの値または配列
-        """
-        # フルエンスの単位変換係数
-        fluence_factors = {
-            'J/m2': 1.0,
-            'mJ/m2': 1e-3,
-            'uJ/m2': 1e-6,
-            'nJ/m2': 1e-9,
-            'J/cm2': 1e4,
-            'mJ/cm2': 10.0,
-            'uJ/cm2': 1e-2,
-            'nJ/cm2': 1e-5
-        }
+    Returns:
+        変換後の周波数の配列
+    """
+    return cast(np.ndarray, convert_frequency(np.asarray(frequencies, dtype=np.float64),
+                                              from_unit, to_unit))
+
+
+def convert_wavenumber_batch(wavenumbers: Sequence[float],
+                             from_unit: str, to_unit: str) -> np.ndarray:
+    """
+    波数の単位変換（リストなどの一括変換）
+    
+    Args:
+        wavenumbers: 波数の値のシーケンス
+        from_unit: 変換前の単位
+        to_unit: 変換後の単位
         
-        if from_unit not in fluence_factors or to_unit not in fluence_factors:
-            raise ValueError(f"サポートされていない単位: {from_unit} または {to_unit}")
+    Returns:
+        変換後の波数の配列
+    """
+    return cast(np.ndarray, convert_wavenumber(np.asarray(wavenumbers, dtype=np.float64),
+                                               from_unit, to_unit))
+
+
+def convert_fluence_batch(fluences: Sequence[float],
+                          from_unit: str, to_unit: str) -> np.ndarray:
+    """
+    フルエンスの単位変換（リストなどの一括変換）
+    
+    Args:
+        fluences: フルエンスの値のシーケンス
+        from_unit: 変換前の単位
+        to_unit: 変換後の単位
         
-        # 基本単位（J/m2）に変換
-        base_value = fluence * fluence_factors[from_unit]
-        # 目標単位に変換
-        return base_value / fluence_factors[to_unit]
-    
-    def convert_electric_field(self, electric_field: Union[float, np.ndarray], 
-                              from_unit: str, to_unit: str) -> Union[float, np.ndarray]:
-        """
-        電場の単位変換
+    Returns:
+        変換後のフルエンスの配列
+    """
+    return cast(np.ndarray, convert_fluence(np.asarray(fluences, dtype=np.float64),
+                                            from_unit, to_unit))
+
+
+def convert_electric_field_batch(electric_fields: Sequence[float],
+                                 from_unit: str, to_unit: str) -> np.ndarray:
+    """
+    電場の単位変換（リストなどの一括変換）
+    
+    Args:
+        electric_fields: 電場の値のシーケンス
+        from_unit: 変換前の単位
+        to_unit: 変換後の単位
         
-        Args:
-            electric_field: 電場の値または配列
-            from_unit: 変換前の単位 ('V/m', 'kV/m', 'MV/m' など)
-            to_unit: 変換後の単位
-            
-        Returns:
-            変換後の電場の値または配列
-        """
-        if from_unit not in self.electric_field_factors or to_unit not in self.electric_field_factors:
-            raise ValueError(f"サポートされていない単位: {from_unit} または {to_unit}")
+    Returns:
+        変換後の電場の配列
+    """
+    return cast(np.ndarray, convert_electric_field(np.asarray(electric_fields, dtype=np.float64),
+                                                   from_unit, to_unit))
+
+
+def convert_intensity_batch(intensities: Sequence[float],
+                            from_unit: str, to_unit: str) -> np.ndarray:
+    """
+    強度の単位変換（リストなどの一括変換）
+    
+    Args:
+        intensities: 強度の値のシーケンス
+        from_unit: 変換前の単位
+        to_unit: 変換後の単位
         
-        # 基本単位（V/m）に変換
-        base_value = electric_field * self.electric_field_factors[from_unit]
-        # 目標単位に変換
-        return base_value / self.electric_field_factors[to_unit]
-    
-    def convert_intensity(self, intensity: Union[float, np.ndarray], 
-                         from_unit: str, to_unit: str) -> Union[float, np.ndarray]:
-        """
-        強度（Intensity）の単位変換
+    Returns:
+        変換後の強度の配列
+    """
+    return cast(np.ndarray, convert_intensity(np.asarray(intensities, dtype=np.float64),
+                                              from_unit, to_unit))
+
+
+def wavelength_to_frequency(wavelength: Union[float, np.ndarray],
+                            wavelength_unit: str, frequency_unit: str,
+                            out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
+    """
+    波長から周波数への変換
+    
+    Args:
+        wavelength: 波長の値または配列
+        wavelength_unit: 波長の単位
+        frequency_unit: 周波数の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
         
-        Args:
-            intensity: 強度の値または配列
-            from_unit: 変換前の単位 ('W/m2', 'W/cm2', 'mW/cm2' など)
-            to_unit: 変換後の単位
-            
-        Returns:
-            変換後の強度の値または配列
-        """
-        if from_unit not in self.intensity_factors or to_unit not in self.intensity_factors:
-            raise ValueError(f"サポートされていない単位: {from_unit} または {to_unit}")
+    Returns:
+        周波数の値または配列
+    """
+    k = _coef('wavelength_to_frequency', wavelength_unit, frequency_unit)
+    return _divide(k, wavelength, out)
+
+
+def frequency_to_wavelength(frequency: Union[float, np.ndarray],
+                            frequency_unit: str, wavelength_unit: str,
+                            out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
+    """
+    周波数から波長への変換
+    
+    Args:
+        frequency: 周波数の値または配列
+        frequency_unit: 周波数の単位
+        wavelength_unit: 波長の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
         
-        # 基本単位（W/m2）に変換
-        base_value = intensity * self.intensity_factors[from_unit]
-        # 目標単位に変換
-        return base_value / self.intensity_factors[to_unit]
-    
-    def wavelength_to_frequency(self, wavelength: Union[float, np.ndarray], 
-                               wavelength_unit: str, frequency_unit: str) -> Union[float, np.ndarray]:
-        """
-        波長から周波数への変換
+    Returns:
+        波長の値または配列
+    """
+    k = _coef('frequency_to_wavelength', frequency_unit, wavelength_unit)
+    return _divide(k, frequency, out)
+
+
+def wavelength_to_wavenumber(wavelength: Union[float, np.ndarray],
+                             wavelength_unit: str, wavenumber_unit: str,
+                             out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
+    """
+    波長から波数への変換
+    
+    Args:
+        wavelength: 波長の値または配列
+        wavelength_unit: 波長の単位
+        wavenumber_unit: 波数の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
         
-        Args:
-            wavelength: 波長の値または配列
-            wavelength_unit: 波長の単位
-            frequency_unit: 周波数の単位
-            
-        Returns:
-            周波数の値または配列
-        """
-        # 波長をメートルに変換
-        wavelength_m = self.convert_wavelength(wavelength, wavelength_unit, 'm')
-        # 周波数を計算 (f = c/λ)
-        frequency_hz = self.C / wavelength_m
-        # 目標単位に変換
-        return self.convert_frequency(frequency_hz, 'Hz', frequency_unit)
-    
-    def frequency_to_wavelength(self, frequency: Union[float, np.ndarray], 
-                               frequency_unit: str, wavelength_unit: str) -> Union[float, np.ndarray]:
-        """
-        周波数から波長への変換
+    Returns:
+        波数の値または配列
+    """
+    k = _coef('wavelength_to_wavenumber', wavelength_unit, wavenumber_unit)
+    return _divide(k, wavelength, out)
+
+
+def wavenumber_to_wavelength(wavenumber: Union[float, np.ndarray],
+                             wavenumber_unit: str, wavelength_unit: str,
+                             out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
+    """
+    波数から波長への変換
+    
+    Args:
+        wavenumber: 波数の値または配列
+        wavenumber_unit: 波数の単位
+        wavelength_unit: 波長の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
         
-        Args:
-            frequency: 周波数の値または配列
-            frequency_unit: 周波数の単位
-            wavelength_unit: 波長の単位
-            
-        Returns:
-            波長の値または配列
-        """
-        # 周波数をHzに変換
-        frequency_hz = self.convert_frequency(frequency, frequency_unit, 'Hz')
-        # 波長を計算 (λ = c/f)
-        wavelength_m = self.C / frequency_hz
-        # 目標単位に変換
-        return self.convert_wavelength(wavelength_m, 'm', wavelength_unit)
-    
-    def wavelength_to_wavenumber(self, wavelength: Union[float, np.ndarray], 
-                                wavelength_unit: str, wavenumber_unit: str) -> Union[float, np.ndarray]:
-        """
-        波長から波数への変換
+    Returns:
+        波長の値または配列
+    """
+    k = _coef('wavenumber_to_wavelength', wavenumber_unit, wavelength_unit)
+    return _divide(k, wavenumber, out)
+
+
+def intensity_to_electric_field(intensity: Union[float, np.ndarray],
+                                intensity_unit: str, electric_field_unit: str,
+                                out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
+    """
+    強度から電場への変換
+    
+    Args:
+        intensity: 強度の値または配列
+        intensity_unit: 強度の単位
+        electric_field_unit: 電場の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
         
-        Args:
-            wavelength: 波長の値または配列
-            wavelength_unit: 波長の単位
-            wavenumber_unit: 波数の単位
-            
-        Returns:
-            波数の値または配列
-        """
-        # 波長をメートルに変換
-        wavelength_m = self.convert_wavelength(wavelength, wavelength_unit, 'm')
-        # 波数を計算 (k = 2π/λ)
-        wavenumber_perm = 2 * np.pi / wavelength_m
-        # 目標単位に変換
-        return self.convert_wavenumber(wavenumber_perm, '1/m', wavenumber_unit)
-    
-    def wavenumber_to_wavelength(self, wavenumber: Union[float, np.ndarray], 
-                                wavenumber_unit: str, wavelength_unit: str) -> Union[float, np.ndarray]:
-        """
-        波数から波長への変換
+    Returns:
+        電場の値または配列
+    """
+    k = _coef('intensity_to_electric_field', intensity_unit, electric_field_unit)
+    if out is None and isinstance(intensity, (int, float)):
+        e_squared = k * intensity
+        # 配列の場合と同じく、負の強度は nan を返す
+        return math.sqrt(e_squared) if e_squared >= 0 else math.nan
+    x = np.asarray(intensity)
+    if _use_numba(x, out):
+        return _run_kernel('_sqrt_linear', x, k, out)
+    if x.ndim == 0 and out is None:
+        return np.sqrt(k * x)
+    # k*I の結果配列に sqrt を上書きし、一時配列の確保を1回で済ませる
+    result = np.multiply(x, k, out=out)
+    return np.sqrt(result, out=result)
+
+
+def electric_field_to_intensity(electric_field: Union[float, np.ndarray],
+                                electric_field_unit: str, intensity_unit: str,
+                                out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
+    """
+    電場から強度への変換
+    
+    Args:
+        electric_field: 電場の値または配列
+        electric_field_unit: 電場の単位
+        intensity_unit: 強度の単位
+        out: 結果を書き込む配列（省略時は新しく確保する）
         
-        Args:
-            wavenumber: 波数の値または配列
-            wavenumber_unit: 波数の単位
-            wavelength_unit: 波長の単位
-            
-        Returns:
-            波長の値または配列
-        """
-        # 波数を1/mに変換
-        wavenumber_perm = self.convert_wavenumber(wavenumber, wavenumber_unit, '1/m')
-        # 波長を計算 (λ = 2π/k)
-        wavelength_m = 2 * np.pi / wavenumber_perm
-        # 目標単位に変換
-        return self.convert_wavelength(wavelength_m, 'm', wavelength_unit)
-    
-    def intensity_to_electric_field(self, intensity: Union[float, np.ndarray], 
-                                   intensity_unit: str, electric_field_unit: str) -> Union[float, np.ndarray]:
-        """
-        強度から電場への変換
+    Returns:
+        強度の値または配列
+    """
+    k = _coef('electric_field_to_intensity', electric_field_unit, intensity_unit)
+    if out is None and isinstance(electric_field, (int, float)):
+        return k * electric_field * electric_field
+    x = np.asarray(electric_field)
+    if _use_numba(x, out):
+        return _run_kernel('_square_linear', x, k, out)
+    if out is None:
+        if x.ndim == 0:
+            return k * x * x
+        # k*E の結果配列に E を掛け、一時配列の確保を1回で済ませる
+        result = np.multiply(x, k)
+        return np.multiply(result, x, out=result)
+    # out が入力と同じ配列でも正しく計算できるよう、先に2乗してから係数を掛ける
+    np.multiply(x, x, out=out, dtype=out.dtype)
+    return np.multiply(out, k, out=out)
+
+
+def convert_laser_pulse(wavelength: Union[float, np.ndarray], intensity: Union[float, np.ndarray], *,
+                        wavelength_unit: str, intensity_unit: str, frequency_unit: str,
+                        wavenumber_unit: str, electric_field_unit: str
+                        ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray], Union[float, np.ndarray]]:
+    """
+    レーザーパルスの波長・強度から周波数・波数・電場をまとめて計算する
+    
+    Numbaが使える場合、同じ形状の大きなfloat64配列は1回のループで計算する
+    
+    Args:
+        wavelength: 波長の値または配列
+        intensity: 強度の値または配列
+        wavelength_unit: 波長の単位
+        intensity_unit: 強度の単位
+        frequency_unit: 周波数の単位
+        wavenumber_unit: 波数の単位
+        electric_field_unit: 電場の単位
         
-        Args:
-            intensity: 強度の値または配列
-            intensity_unit: 強度の単位
-            electric_field_unit: 電場の単位
-            
-        Returns:
-            電場の値または配列
-        """
-        # 強度をW/m2に変換
-        intensity_wpm2 = self.convert_intensity(intensity, intensity_unit, 'W/m2')
-        # 電場を計算 (E = sqrt(2*I/(c*ε0)))
-        electric_field_vpm = np.sqrt(2 * intensity_wpm2 / (self.C * self.EPSILON0))
-        # 目標単位に変換
-        return self.convert_electric_field(electric_field_vpm, 'V/m', electric_field_unit)
-    
-    def electric_field_to_intensity(self, electric_field: Union[float, np.ndarray], 
-                                   electric_field_unit: str, intensity_unit: str) -> Union[float, np.ndarray]:
-        """
-        電場から強度への変換
+    Returns:
+        (周波数, 波数, 電場) の値または配列
+    """
+    if (isinstance(wavelength, np.ndarray) and isinstance(intensity, np.ndarray)
+            and _use_numba(wavelength) and _use_numba(intensity)
+            and wavelength.dtype == intensity.dtype == np.float64
+            and wavelength.shape == intensity.shape):
+        k_frequency = _coef('wavelength_to_frequency', wavelength_unit, frequency_unit)
+        k_wavenumber = _coef('wavelength_to_wavenumber', wavelength_unit, wavenumber_unit)
+        k_electric_field = _coef('intensity_to_electric_field', intensity_unit, electric_field_unit)
+        frequency = np.empty(wavelength.shape, dtype=np.float64)
+        wavenumber = np.empty(wavelength.shape, dtype=np.float64)
+        electric_field = np.empty(intensity.shape, dtype=np.float64)
+        _numba_kernels()._laser_pulse(frequency.reshape(-1), wavenumber.reshape(-1),
+                                      electric_field.reshape(-1),
+                                      np.ravel(wavelength), np.ravel(intensity),
+                                      k_frequency, k_wavenumber, k_electric_field)
+        return frequency, wavenumber, electric_field
+    
+    return (wavelength_to_frequency(wavelength, wavelength_unit, frequency_unit),
+            wavelength_to_wavenumber(wavelength, wavelength_unit, wavenumber_unit),
+            intensity_to_electric_field(intensity, intensity_unit, electric_field_unit))
+
+
+def make_converter(kind: str, from_unit: str, to_unit: str) -> Callable[[float], float]:
+    """
+    単位の組を固定した変換関数を作成する
+    
+    ループ内で同じ単位の変換を繰り返す場合、変換関数を一度だけ作成しておけば
+    呼び出しごとの単位の検証や係数の取得を省略できる
+    
+    Args:
+        kind: 物理量名 ('wavelength', 'intensity' など) または
+              物理量間の変換名 ('wavelength_to_frequency' など)
+        from_unit: 変換前の単位
+        to_unit: 変換後の単位
         
-        Args:
-            electric_field: 電場の値または配列
-            electric_field_unit: 電場の単位
-            intensity_unit: 強度の単位
-            
-        Returns:
-            強度の値または配列
-        """
-        # 電場をV/mに変換
-        electric_field_vpm = self.convert_electric_field(electric_field, electric_field_unit, 'V/m')
-        # 強度を計算 (I = (1/2)*c*ε0*E^2)
-        intensity_wpm2 = 0.5 * self.C * self.EPSILON0 * electric_field_vpm**2
-        # 目標単位に変換
-        return self.convert_intensity(intensity_wpm2, 'W/m2', intensity_unit)
+    Returns:
+        値を1つ受け取り変換後の値を返す関数
+        ('intensity_to_electric_field' はスカラー値のみ対応)
+    """
+    if kind in _LINEAR_TABLES:
+        ratio = _ratio(_LINEAR_TABLES[kind], from_unit, to_unit)
+        return lambda x: x * ratio
+    if kind not in _CROSS_CONVERSIONS:
+        raise ValueError(f"サポートされていない変換: {kind}")
+    
+    k = _coef(kind, from_unit, to_unit)
+    if kind == 'intensity_to_electric_field':
+        return lambda x: math.sqrt(k * x) if k * x >= 0 else math.nan
+    if kind == 'electric_field_to_intensity':
+        return lambda x: k * x * x
+    return lambda x: k / x
+
+
+class UnitConverter:
+    """
+    物理量の単位変換を行うクラス
+    対応物理量: フルエンス、波長、波数、周波数、電場、intensity
+    
+    状態を持たず、各メソッドは同名のモジュール関数を呼び出す
+    """
+    
+    # 物理定数
+    C = C
+    H = H
+    HBAR = HBAR
+    EPSILON0 = EPSILON0
+    MU0 = MU0
+    
+    # 単位変換係数（読み取り専用）
+    length_factors = _LENGTH
+    time_factors = _TIME
+    energy_factors = _ENERGY
+    frequency_factors = _FREQUENCY
+    wavenumber_factors = _WAVENUMBER
+    fluence_factors = _FLUENCE
+    electric_field_factors = _ELECTRIC_FIELD
+    intensity_factors = _INTENSITY
+    
+    # 単位変換
+    convert_wavelength = staticmethod(convert_wavelength)
+    convert_frequency = staticmethod(convert_frequency)
+    convert_wavenumber = staticmethod(convert_wavenumber)
+    convert_fluence = staticmethod(convert_fluence)
+    convert_electric_field = staticmethod(convert_electric_field)
+    convert_intensity = staticmethod(convert_intensity)
+    
+    # 一括変換
+    convert_wavelength_batch = staticmethod(convert_wavelength_batch)
+    convert_frequency_batch = staticmethod(convert_frequency_batch)
+    convert_wavenumber_batch = staticmethod(convert_wavenumber_batch)
+    convert_fluence_batch = staticmethod(convert_fluence_batch)
+    convert_electric_field_batch = staticmethod(convert_electric_field_batch)
+    convert_intensity_batch = staticmethod(convert_intensity_batch)
+    
+    # 物理量間の変換
+    wavelength_to_frequency = staticmethod(wavelength_to_frequency)
+    frequency_to_wavelength = staticmethod(frequency_to_wavelength)
+    wavelength_to_wavenumber = staticmethod(wavelength_to_wavenumber)
+    wavenumber_to_wavelength = staticmethod(wavenumber_to_wavelength)
+    intensity_to_electric_field = staticmethod(intensity_to_electric_field)
+    electric_field_to_intensity = staticmethod(electric_field_to_intensity)
+    convert_laser_pulse = staticmethod(convert_laser_pulse)
+    
+    make_converter = staticmethod(make_converter)
 
 
 # 使用例とテスト用の関数
@@ -0,0 +1,37 @@
+"""
+UnitConverterの大規模配列向けNumbaカーネル
+
+UnitConverter は初めて大規模配列を変換するときにこのモジュールを読み込む。
+numbaがインストールされていない場合は読み込まれず、通常のnumpy演算を使用する。
+"""
+
+import math
+
+from numba import njit, prange
+
+# カーネルは初回呼び出し時に引数の型に合わせてコンパイルされる（cache=True でディスクに保存）
+# 呼び出し側は常にC連続の1次元配列を渡すため、ストライド1のループとしてSIMD化される
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _sqrt_linear(out, x, k):
+    """out = sqrt(k*x)"""
+    for i in prange(x.size):
+        out[i] = math.sqrt(k * x[i])
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _square_linear(out, x, k):
+    """out = k*x^2"""
+    for i in prange(x.size):
+        out[i] = k * x[i] * x[i]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _laser_pulse(frequency, wavenumber, electric_field, wavelength, intensity,
+                 k_frequency, k_wavenumber, k_electric_field):
+    """波長・強度から周波数・波数・電場を1回のループで計算する"""
+    for i in prange(wavelength.size):
+        frequency[i] = k_frequency / wavelength[i]
+        wavenumber[i] = k_wavenumber / wavelength[i]
+        electric_field[i] = math.sqrt(k_electric_field * intensity[i])